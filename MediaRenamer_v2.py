@@ -22,18 +22,30 @@ Designed for clarity, reproducibility, and robustness in real-world libraries.
 """
 
 import os
+import re
+import atexit
+import struct
 import ffmpeg
 import exifread
 import subprocess
-import pandas as pd
+import concurrent.futures
 import lib.lib_logger as lib_logger
 from typing import Optional
-from dataclasses import asdict, dataclass
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timezone
-from itertools import product
 from pillow_heif import register_heif_opener
 
+# Optional Numba acceleration for the mutual-grouping kernel;
+# a missing install falls back to the plain dict path
+try:
+    import numpy as np
+    from numba import njit, types as nb_types
+    from numba.typed import Dict as NumbaDict
+except ImportError:
+    njit = None
+
 
 # Constants
 APP_NAME = Path(__file__).stem
@@ -43,37 +55,33 @@ ISO_FORMAT = "%Y-%m-%d %H:%M:%S"
 YEARS = range(2018, 2027)
 BASE = r"X:\_Media"
 BASE = r"D:"
-CMD_DIR = "dir /B /o:d"
 NAME_LENGTH = 15
 LINE_LENGTH = 50
 YES = True
 NO = False
 
+# Extension order matters: EXIF types first, FFmpeg types next, OS-only
+# last, so type checks can compare interned ids against range bounds
 FILE_EXTENSIONS = ["jpg", "heic", "mov", "mp4", "mpg", "gif", "m4a"]
-EXIF_TAGS = ["Image DateTime", "EXIF DateTimeOriginal", "EXIF DateTimeDigitized"]
+_EXT_PATTERN = re.compile(r"\.(" + "|".join(FILE_EXTENSIONS) + r")$", re.IGNORECASE)
+_EXT_INTERN = {ext: i for i, ext in enumerate(FILE_EXTENSIONS)}
+
+# Log separators and per-extension headers, built once
+LINE_DASH = "-" * LINE_LENGTH
+LINE_STAR = "*" * LINE_LENGTH
+LINE_EQUAL = "=" * LINE_LENGTH
+_EXT_HEADERS = {
+    ext: str.center(f" {ext.upper()} ", LINE_LENGTH, "=") for ext in FILE_EXTENSIONS
+}
+
+# Folder paths are interned to small ints; one string per distinct folder
+_FOLDER_INTERN: dict[str, int] = {}
+_FOLDER_NAMES: list[str] = []
+EXIF_TAGS = ["EXIF DateTimeOriginal", "EXIF DateTimeDigitized", "Image DateTime"]
 FFMPEG_TAGS = ["com.apple.quicktime.creationdate", "creation_time"]
 
-_COL_METADATA = [
-    "no",
-    "folder",
-    "first_name",
-    "actual_name",
-    "actual_full_name",
-    "actual_full_path",
-    "date_taken",
-    "new_name",
-    "new_full_name",
-    "new_full_path",
-    "ext",
-    "is_mutual",
-    "mutual_order",
-    "mutual_suffix",
-    "has_conflict",
-    "conflict_suffix",
-]
-
-
-@dataclass
+
+@dataclass(slots=True)
 class FileMetadata:
     """
     Holds all metadata used during the media renaming process.
@@ -85,21 +93,44 @@ class FileMetadata:
     """
 
     no: int = 0
-    folder: str | None = None
+    folder_id: int = -1
     first_name: str | None = None
     actual_name: str | None = None
     actual_full_name: str | None = None
     actual_full_path: str | None = None
     date_taken: str | None = None
+    date_taken_ns: int = 0
     new_name: str | None = None
     new_full_name: str | None = None
     new_full_path: str | None = None
-    ext: str | None = None
+    ext_id: int = -1
     is_mutual: bool = NO
     mutual_order: int = 0
     mutual_suffix: str = ""
     has_conflict: bool = NO
     conflict_suffix: str = ""
+    _ctime_ns: int = 0
+    _mtime_ns: int = 0
+
+    @property
+    def folder(self) -> str | None:
+        """String form of the interned folder id."""
+        return _FOLDER_NAMES[self.folder_id] if self.folder_id >= 0 else None
+
+    @property
+    def ext(self) -> str | None:
+        """String form of the interned extension id."""
+        return FILE_EXTENSIONS[self.ext_id] if self.ext_id >= 0 else None
+
+
+def _intern_folder(folder: str) -> int:
+    """Intern a folder path and return its small-int id."""
+    folder_id = _FOLDER_INTERN.get(folder)
+    if folder_id is None:
+        folder_id = len(_FOLDER_NAMES)
+        _FOLDER_INTERN[folder] = folder_id
+        _FOLDER_NAMES.append(folder)
+    return folder_id
 
 
 def set_file_metadata(
@@ -107,7 +138,7 @@ def set_file_metadata(
     folder: str | None = None,
     first_name: str | None = None,
     actual_name: str | None = None,
-    date_taken: str | None = None,
+    date_taken_ns: int = 0,
     new_name: str | None = None,
     ext: str | None = None,
     is_mutual: bool | None = None,
@@ -125,14 +156,17 @@ def set_file_metadata(
     - Handles mutual-group suffixes and conflict suffixes.
     """
 
-    # Update basic fields only when provided
+    # Update basic fields only when provided; folder and extension are
+    # stored as interned ids
     file_meta.no = no or file_meta.no
-    file_meta.folder = folder or file_meta.folder
+    if folder:
+        file_meta.folder_id = _intern_folder(folder)
     file_meta.first_name = first_name or file_meta.first_name
     file_meta.actual_name = actual_name or file_meta.actual_name
-    file_meta.date_taken = date_taken or file_meta.date_taken
+    file_meta.date_taken_ns = date_taken_ns or file_meta.date_taken_ns
     file_meta.new_name = new_name or file_meta.new_name
-    file_meta.ext = ext or file_meta.ext
+    if ext:
+        file_meta.ext_id = _EXT_INTERN[ext]
 
     # Mutual group flags
     if is_mutual is not None:
@@ -147,9 +181,21 @@ def set_file_metadata(
     if conflict_suffix is not None:
         file_meta.conflict_suffix = conflict_suffix
 
-    # Rebuild full names and paths
-    set_actual_name(file_meta)
-    set_new_name(file_meta)
+    # Rebuild names only when an input of the respective builder changed;
+    # everything else (no, flags) leaves the strings untouched
+    actual_dirty = bool(actual_name or ext or folder)
+    new_dirty = bool(
+        date_taken_ns
+        or new_name
+        or mutual_order > 0
+        or conflict_suffix is not None
+        or ext
+        or folder
+    )
+    if actual_dirty:
+        set_actual_name(file_meta)
+    if new_dirty:
+        set_new_name(file_meta)
 
 
 def set_actual_name(meta: FileMetadata):
@@ -175,9 +221,13 @@ def set_new_name(meta: FileMetadata):
     """
 
     # If no date and no new name, nothing to build
-    if not meta.date_taken and not meta.new_name:
+    if not meta.date_taken_ns and not meta.new_name:
         return
 
+    # Render the stored epoch value lazily, only when a name is built
+    if meta.date_taken_ns:
+        meta.date_taken = date_to_str(meta.date_taken_ns)
+
     # Prefer EXIF/OS date; fallback to manually assigned new_name
     meta.new_name = meta.date_taken or meta.new_name
 
@@ -203,16 +253,19 @@ def concat_full_path(
     ext: str | None = None,
 ):
     """Return full file path by combining folder and full file name."""
-    # Build full file path
-    full_name = concat_full_name(file_name, ext)  # type: ignore
-    full_path = str(Path(folder) / concat_full_name(file_name, ext))
+    # Single f-string build; folders come from os.walk, already normalized
+    full_path = f"{folder}{os.sep}{concat_full_name(file_name, ext)}"
     return full_path
 
 
-def date_to_str(date_obj: datetime):
-    """Convert datetime object to formatted string, or return None."""
-    # If no date object, return None
-    date_taken = date_obj.strftime(NAME_FORMAT) if date_obj else None
+def date_to_str(date_ns: int):
+    """Convert an epoch-nanosecond timestamp to a formatted string, or None."""
+    # If no timestamp, return None
+    if not date_ns:
+        return None
+    date_taken = datetime.fromtimestamp(date_ns / 1e9, tz=timezone.utc).strftime(
+        NAME_FORMAT
+    )
     return date_taken
 
 
@@ -231,13 +284,15 @@ def get_utc_time(_time: datetime):
     return r_time
 
 
-def get_os_date(full_path: str):
+def get_os_date(full_path: str, ctime_ns: int = 0, mtime_ns: int = 0):
     """Return the earliest of creation or modification time as UTC datetime."""
-    # Get file system timestamps
-    c_time = datetime.fromtimestamp(os.path.getctime(full_path))
-    c_time = get_utc_time(c_time)
-    m_time = datetime.fromtimestamp(os.path.getmtime(full_path))
-    m_time = get_utc_time(m_time)
+    # Reuse the timestamps cached by the folder scan; stat only when absent
+    if not (ctime_ns and mtime_ns):
+        stat = os.stat(full_path)
+        ctime_ns, mtime_ns = stat.st_ctime_ns, stat.st_mtime_ns
+
+    c_time = get_utc_time(datetime.fromtimestamp(ctime_ns / 1e9))
+    m_time = get_utc_time(datetime.fromtimestamp(mtime_ns / 1e9))
 
     # OS date cannot be empty.
     date_taken = get_min(c_time, m_time)
@@ -249,23 +304,103 @@ from datetime import datetime
 from typing import Optional
 
 
+def _iter_ifd(buf: bytes, base: int, ifd_offset: int, endian: str):
+    """Yield (tag, value_offset) pairs from one IFD of a TIFF structure."""
+    (count,) = struct.unpack_from(f"{endian}H", buf, base + ifd_offset)
+    for i in range(count):
+        entry = base + ifd_offset + 2 + i * 12
+        tag, _type, _count, value_offset = struct.unpack_from(
+            f"{endian}HHII", buf, entry
+        )
+        yield tag, value_offset
+
+
+def _read_exif_date(buf: bytes, base: int, value_offset: int) -> Optional[datetime]:
+    """Decode one 19-byte 'YYYY:MM:DD HH:MM:SS' EXIF value."""
+    raw = buf[base + value_offset : base + value_offset + 19]
+    try:
+        dt = datetime.strptime(raw.decode("ascii"), DT_FORMAT)
+        return get_utc_time(dt)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _parse_exif_fast(full_path: str) -> Optional[datetime]:
+    """
+    Minimal EXIF date parser that reads only the JPEG header bytes.
+
+    Locates the APP1/TIFF structure in the first 64KB, walks IFD0 and the
+    Exif sub-IFD, and decodes just the three datetime tags instead of
+    letting exifread walk every tag in the file. Returns None on any
+    structural surprise so the caller can fall back to exifread.
+    """
+    try:
+        with open(full_path, "rb") as image:
+            buf = image.read(65536)
+
+        # JPEG SOI marker plus the embedded "Exif\0\0" identifier
+        if not buf.startswith(b"\xff\xd8"):
+            return None
+        idx = buf.find(b"Exif\x00\x00")
+        if idx < 0:
+            return None
+
+        # TIFF header: byte order, then the offset to IFD0
+        base = idx + 6
+        order = buf[base : base + 2]
+        if order == b"II":
+            endian = "<"
+        elif order == b"MM":
+            endian = ">"
+        else:
+            return None
+        (ifd0_offset,) = struct.unpack_from(f"{endian}I", buf, base + 4)
+
+        dt_original = dt_digitized = dt_image = None
+        exif_ifd_offset = 0
+
+        # Walk IFD0 for DateTime (0x0132) and the Exif sub-IFD pointer
+        for tag, value_offset in _iter_ifd(buf, base, ifd0_offset, endian):
+            if tag == 0x0132:
+                dt_image = _read_exif_date(buf, base, value_offset)
+            elif tag == 0x8769:
+                exif_ifd_offset = value_offset
+
+        # Walk the Exif sub-IFD for DateTimeOriginal / DateTimeDigitized
+        if exif_ifd_offset:
+            for tag, value_offset in _iter_ifd(buf, base, exif_ifd_offset, endian):
+                if tag == 0x9003:
+                    dt_original = _read_exif_date(buf, base, value_offset)
+                elif tag == 0x9004:
+                    dt_digitized = _read_exif_date(buf, base, value_offset)
+
+        # First available tag wins, in priority order
+        return dt_original or dt_digitized or dt_image
+    except Exception:
+        return None
+
+
 def get_date_taken(full_path: str) -> Optional[datetime]:
     """
-    Extract the earliest valid datetime value from EXIF metadata using exifread.
+    Extract the highest-priority valid datetime value from EXIF metadata.
     Checked tags (in order of priority):
         - DateTimeOriginal
         - DateTimeDigitized
         - DateTime
 
-    Returns the earliest UTC-normalized datetime found, or None.
+    Tries the minimal header parser first (JPEG), then exifread.
+    Returns the first UTC-normalized datetime found, or None.
     """
-    date_taken: Optional[datetime] = None
+    # Fast path: parse the EXIF header bytes directly
+    date_taken = _parse_exif_fast(full_path)
+    if date_taken:
+        return date_taken
 
-    # Read EXIF data from the image file
-    with open(Path(full_path), "rb") as image:
+    # Fallback: read EXIF data with exifread (HEIC, odd JPEGs)
+    with open(full_path, "rb") as image:
         exif = exifread.process_file(image, details=False)
 
-    # Check known EXIF date tags
+    # Check known EXIF date tags; first parsable tag wins
     for tag in EXIF_TAGS:
         raw = exif.get(tag)
         if not raw:
@@ -274,55 +409,157 @@ def get_date_taken(full_path: str) -> Optional[datetime]:
         # Parse and normalize the datetime
         try:
             dt = datetime.strptime(str(raw), DT_FORMAT)
-            dt = get_utc_time(dt)
-            date_taken = get_min(date_taken, dt)
+            return get_utc_time(dt)
         except Exception:
             ...
-    return date_taken
+    return None
+
+
+def _get_exiftool() -> Optional[subprocess.Popen]:
+    """
+    Launch (at most once per process) a persistent exiftool batch process.
+
+    Uses exiftool's `-stay_open` mode so one process serves every file,
+    amortizing the subprocess startup cost over the whole library.
+    Returns None when exiftool is not available.
+    """
+    global _exiftool_proc, _exiftool_unavailable
+
+    # Reuse the running process, or give up if exiftool is not installed
+    if _exiftool_unavailable:
+        return None
+    if _exiftool_proc is not None and _exiftool_proc.poll() is None:
+        return _exiftool_proc
+
+    try:
+        _exiftool_proc = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        atexit.register(_close_exiftool)
+    except OSError:
+        _exiftool_unavailable = YES
+        _exiftool_proc = None
+    return _exiftool_proc
+
+
+def _close_exiftool():
+    """Ask the persistent exiftool process to shut down cleanly."""
+    global _exiftool_proc
+    if _exiftool_proc is None or _exiftool_proc.poll() is not None:
+        return
+    try:
+        _exiftool_proc.stdin.write("-stay_open\nFalse\n")  # type: ignore
+        _exiftool_proc.stdin.flush()  # type: ignore
+        _exiftool_proc.wait(timeout=5)
+    except Exception:
+        _exiftool_proc.kill()
+
+
+def get_exiftool_time(full_path: str) -> Optional[datetime]:
+    """Extract CreateDate from media metadata using the persistent exiftool."""
+    proc = _get_exiftool()
+    if proc is None:
+        return None
+
+    # Stream the file name in and read until the {ready} sentinel
+    try:
+        proc.stdin.write(f"-CreateDate\n-s\n-s\n-s\n{full_path}\n-execute\n")  # type: ignore
+        proc.stdin.flush()  # type: ignore
+        lines = []
+        while True:
+            line = proc.stdout.readline()  # type: ignore
+            if not line or line.startswith("{ready}"):
+                break
+            lines.append(line.strip())
+    except Exception:
+        return None
+
+    # Parse the returned timestamp, ignoring any trailing timezone offset
+    for raw in lines:
+        try:
+            dt = datetime.strptime(raw[:19], DT_FORMAT)
+            return get_utc_time(dt)
+        except ValueError:
+            ...
+    return None
 
 
 def get_ffmpeg_time(full_path: str) -> Optional[datetime]:
     """Extract date taken from media metadata using ffmpeg."""
-    path = Path(full_path)
     try:
-        probe = ffmpeg.probe(path)
+        probe = ffmpeg.probe(full_path)
     except Exception as _:
         return None
 
     # Extract relevant tags from ffmpeg metadata
     format_tags = probe.get("format", {}).get("tags", {})
-    date_ffmpeg = None
 
-    # Check known ffmpeg date tags
+    # Check known ffmpeg date tags; first available tag wins
     for tag in FFMPEG_TAGS:
         dt = format_tags.get(tag)
         if dt:
             dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-            dt = get_utc_time(dt)
-            date_ffmpeg = get_min(date_ffmpeg, dt)
-    return date_ffmpeg
+            return get_utc_time(dt)
+    return None
 
 
-def find_date_taken(meta: FileMetadata) -> Optional[datetime]:
-    """Determine the date taken for a file using EXIF, FFmpeg, and OS timestamps."""
-    full_path = meta.actual_full_path
-    ext = meta.ext
+def find_date_taken(
+    full_path: str,
+    ext_id: int,
+    ctime_ns: int = 0,
+    mtime_ns: int = 0,
+) -> int:
+    """
+    Determine the date taken for a file using EXIF, FFmpeg, and OS timestamps.
+
+    Returns the date as epoch nanoseconds (0 when nothing was found), so
+    downstream grouping and comparisons work on plain int64 values.
+    """
     date_taken = None
 
-    # Try EXIF or FFmpeg depending on file type
-    if ext in ["jpg", "heic"]:
-        date_taken = get_date_taken(full_path)  # type: ignore
-    elif ext in ["mov", "mp4", "mpg", "gif"]:
-        date_taken = get_ffmpeg_time(full_path)  # type: ignore
+    # Try EXIF or FFmpeg depending on file type (interned id ranges)
+    if ext_id <= _EXT_INTERN["heic"]:  # jpg, heic
+        date_taken = get_date_taken(full_path)
+    elif ext_id <= _EXT_INTERN["gif"]:  # mov, mp4, mpg, gif
+        # Prefer the persistent exiftool session; fallback to ffprobe
+        date_taken = get_exiftool_time(full_path) or get_ffmpeg_time(full_path)
 
     # Always fallback to OS timestamps
-    date_os = get_os_date(full_path)  # type: ignore
-    return get_min(date_taken, date_os)
+    date_os = get_os_date(full_path, ctime_ns, mtime_ns)
+    date_min = get_min(date_taken, date_os)
+    # Truncate to whole seconds so the grouping key has the same
+    # granularity as the rendered names
+    return int(date_min.timestamp()) * 10**9 if date_min else 0
+
+
+def _extract_date(path_ext_tuple: tuple[str, int, int, int]) -> int:
+    """
+    Worker-side helper for parallel date extraction.
+
+    Takes only picklable scalars (path, extension id, cached stat
+    timestamps) so nothing heavier than a string has to cross the process
+    boundary, and returns the date as epoch nanoseconds. Failures are
+    contained per file: 0 comes back and the main thread logs the miss.
+    """
+    full_path, ext_id, ctime_ns, mtime_ns = path_ext_tuple
+    try:
+        return find_date_taken(full_path, ext_id, ctime_ns, mtime_ns)
+    except Exception as _:
+        return 0
 
 
 def os_rename(meta: FileMetadata):
     """Perform the actual filesystem rename operation."""
-    os.rename(Path(meta.actual_full_path), Path(meta.new_full_path))  # type: ignore
+    # Never overwrite an existing target: collisions must fail loudly so
+    # run_renamer logs them instead of losing a file
+    if os.path.exists(meta.new_full_path):  # type: ignore
+        raise FileExistsError(meta.new_full_path)
+    os.rename(meta.actual_full_path, meta.new_full_path)  # type: ignore
 
 
 def rename_file(meta: FileMetadata, only_conflicts: bool = NO):
@@ -338,63 +575,125 @@ def rename_file(meta: FileMetadata, only_conflicts: bool = NO):
     # No rename needed
     same_name = meta.new_full_name == meta.actual_full_name
     if same_name:
-        logger.info(f"{meta.no}- {meta.actual_full_name}: File names are identical")
+        logger.info("%s- %s: File names are identical", meta.no, meta.actual_full_name)
     else:
         os_rename(meta)
         logger.info(
-            f"{meta.no}- {meta.actual_full_name} >> {meta.new_full_name}: Completed"
+            "%s- %s >> %s: Completed",
+            meta.no,
+            meta.actual_full_name,
+            meta.new_full_name,
         )
-    # Update metadata after rename
+    # Update metadata after rename; only the name index needs patching
+    old_full_name = meta.actual_full_name
     set_file_metadata(meta, actual_name=meta.new_name)
+    _reindex_actual_name(meta, old_full_name)
 
 
-def create_df_global_media(list_metadata: list[FileMetadata]):
-    """Build the global DataFrame from the list of FileMetadata objects."""
-    global df_global_media
+def rebuild_media_index(list_metadata: list[FileMetadata]):
+    """
+    Rebuild the global lookup structures from the FileMetadata objects.
 
-    # Convert metadata objects into a DataFrame using their dict representation
-    df_global_media = pd.DataFrame(
-        [asdict(md) for md in list_metadata],
-        columns=_COL_METADATA,
-    )
-    # Use 'no' as the index for stable ordering
-    df_global_media.set_index("no", drop=True, inplace=True)
-    # Store the original metadata objects for direct access
-    df_global_media["metadata"] = list_metadata
+    Replaces the old pandas DataFrame: two lightweight dicts cover every
+    lookup the pipeline needs (grouping by date/extension and finding
+    files by name), and the plain list serves the conflict scan.
+    """
+    global list_global_media, by_date_ext, by_actual_name
+
+    list_global_media = list_metadata
+    by_date_ext = defaultdict(list)
+    by_actual_name = defaultdict(list)
+    for meta in list_metadata:
+        by_date_ext[(meta.date_taken_ns, meta.ext_id)].append(meta)
+        by_actual_name[meta.actual_full_name].append(meta)
+
+
+def _reindex_actual_name(meta: FileMetadata, old_full_name: str | None):
+    """Patch the name index after a rename instead of rebuilding everything."""
+    metas = by_actual_name.get(old_full_name)
+    if metas is not None:
+        try:
+            metas.remove(meta)
+        except ValueError:
+            ...
+        if not metas:
+            by_actual_name.pop(old_full_name, None)
+    by_actual_name[meta.actual_full_name].append(meta)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _mutual_orders_kernel(dates_ns, ext_ids):
+        """
+        Assign 1-based mutual orders per (date, ext) group on int64 arrays.
+
+        Two passes: count group sizes, then number the members of every
+        group larger than one in file order. 0 means "not mutual".
+        """
+        n = dates_ns.shape[0]
+        orders = np.zeros(n, dtype=np.int32)
+
+        key_type = nb_types.UniTuple(nb_types.int64, 2)
+        counts = NumbaDict.empty(key_type=key_type, value_type=nb_types.int64)
+        for i in range(n):
+            if dates_ns[i] == 0:
+                continue
+            key = (dates_ns[i], ext_ids[i])
+            counts[key] = counts.get(key, 0) + 1
+
+        seen = NumbaDict.empty(key_type=key_type, value_type=nb_types.int64)
+        for i in range(n):
+            if dates_ns[i] == 0:
+                continue
+            key = (dates_ns[i], ext_ids[i])
+            if counts[key] <= 1:
+                continue
+            order = seen.get(key, 0) + 1
+            seen[key] = order
+            orders[i] = order
+        return orders
 
 
 def search_mutual_names(list_metadata: list[FileMetadata], only_conflicts: bool = NO):
     """Mark files with the same date_taken as mutual."""
-    global df_global_media
-
     # If only conflict processing is requested, skip mutual-name detection
     if only_conflicts:
         return
 
-    # Collect all unique dates from the global media dataframe
-    unique_dates = df_global_media["date_taken"].unique().tolist()
-
-    # Iterate over each unique date and file extension combination
-    for date_value, ext in product(unique_dates, FILE_EXTENSIONS):
-        # Find all files matching the current date and extension
-        df_mutual = df_global_media.query(
-            f'date_taken == "{date_value}" and ext == "{ext}"'
+    if njit is not None and list_metadata:
+        # Compiled path: run the grouping kernel on packed int64 arrays
+        count = len(list_metadata)
+        dates_ns = np.fromiter(
+            (meta.date_taken_ns for meta in list_metadata), np.int64, count
         )
-        # If only one file exists for that date, nothing to mark as mutual
-        if df_mutual.index.size <= 1:
-            continue
-
-        # Mark all files with the same date as mutual
-        idx = 0
-        for meta in df_mutual.metadata:
-            idx += 1
-            set_file_metadata(
-                meta,
-                is_mutual=YES,
-                mutual_order=idx,
-            )
-    # Rebuild the global dataframe after updates
-    create_df_global_media(list_metadata)
+        ext_ids = np.fromiter((meta.ext_id for meta in list_metadata), np.int64, count)
+        orders = _mutual_orders_kernel(dates_ns, ext_ids)
+
+        for meta, order in zip(list_metadata, orders):
+            if order:
+                set_file_metadata(
+                    meta,
+                    is_mutual=YES,
+                    mutual_order=int(order),
+                )
+    else:
+        # Fallback path: the (date, ext) index already holds the groups;
+        # undated files must not be lumped together
+        for (date_ns, _ext), metas in by_date_ext.items():
+            # If only one file exists for that date, nothing to mark as mutual
+            if not date_ns or len(metas) <= 1:
+                continue
+
+            # Mark all files with the same date as mutual
+            for idx, meta in enumerate(metas, start=1):
+                set_file_metadata(
+                    meta,
+                    is_mutual=YES,
+                    mutual_order=idx,
+                )
+    # Mutual marking only touches new names, which neither index keys
+    # on, so no rebuild is needed here
 
 
 def reset_conflicts(list_metadata: list[FileMetadata]):
@@ -411,11 +710,9 @@ def reset_conflicts(list_metadata: list[FileMetadata]):
 
 
 def conflict_exists() -> bool:
-    """Check if any file has a conflict flag set in the global DataFrame."""
-    global df_global_media
-
+    """Check if any file has a conflict flag set in the global index."""
     # Check if there is at least one conflicting file
-    has_conflict = not df_global_media.query("has_conflict == True").empty
+    has_conflict = any(meta.has_conflict for meta in list_global_media)
     return has_conflict
 
 
@@ -427,12 +724,10 @@ def check_conflicts(list_metadata: list[FileMetadata], only_conflicts: bool = NO
 
     # Check each file for naming conflicts
     for meta in list_metadata:
-        # Find any other file with the same new name but a different ID
-        df_conflict = df_global_media.query(
-            f'actual_full_name == "{meta.new_full_name}" and no != {meta.no}'
-        )
+        # Find any other file holding the same name as the new name
+        others = by_actual_name.get(meta.new_full_name)
         # No conflict found
-        if df_conflict.empty:
+        if not others or (len(others) == 1 and others[0] is meta):
             continue
         # Mark current file as conflicting
         set_file_metadata(
@@ -440,10 +735,8 @@ def check_conflicts(list_metadata: list[FileMetadata], only_conflicts: bool = NO
             has_conflict=YES,
             conflict_suffix=str(meta.no),
         )
-        # Log the first conflicting file for clarity
-        logger.info(
-            f"{meta.no}- {df_conflict.iloc[0].actual_full_name}: Conflict detected"
-        )
+        # Log the conflicting name for clarity
+        logger.info("%s- %s: Conflict detected", meta.no, meta.new_full_name)
 
 
 def initialize_conflicts(list_metadata: list[FileMetadata]):
@@ -453,7 +746,7 @@ def initialize_conflicts(list_metadata: list[FileMetadata]):
         return
 
     # Visual separator for logging
-    logger.info("*" * LINE_LENGTH)
+    logger.info(LINE_STAR)
     # Centered header for conflict processing
     logger.info(str.center("CONFLICTS RUNNING", LINE_LENGTH, " "))
 
@@ -466,25 +759,26 @@ def run_renamer(list_metadata: list[FileMetadata], only_conflicts: bool = NO):
     global dict_file_counts
 
     # Visual separator for renaming phase
-    logger.info("*" * LINE_LENGTH)
+    logger.info(LINE_STAR)
 
     # Check for conflicts and mark files accordingly
     for meta in list_metadata:
         # Print header for the first file of each extension loop
         if meta.no == 1:
-            logger.info(str.center(f" {meta.ext.upper()} ", LINE_LENGTH, "="))  # type: ignore
+            logger.info(_EXT_HEADERS[meta.ext])
             file_number = dict_file_counts.get(meta.ext, 0)  # type: ignore
-            logger.info(f"{file_number} files being renamed... ")
-            logger.info("-" * LINE_LENGTH)
+            logger.info("%s files being renamed... ", file_number)
+            logger.info(LINE_DASH)
 
         # Attempt to rename the file, logging any errors
         try:
-            logger.info("-")
             rename_file(meta, only_conflicts)
         except Exception as _:
             logger.error(
-                f"{meta.no}- {meta.actual_full_name} - {meta.new_full_name}: "
-                + "Error: An error occurred while renaming file."
+                "%s- %s - %s: Error: An error occurred while renaming file.",
+                meta.no,
+                meta.actual_full_name,
+                meta.new_full_name,
             )
 
 
@@ -493,16 +787,13 @@ def find_file_counts(
 ) -> dict[str, int]:
     """Return the global dictionary of file counts per extension."""
     global dict_file_counts
-    # Count files per extension
-    dict_file_counts = {}
+    # Count files per extension in a single pass
+    dict_file_counts = Counter(
+        meta.ext for meta in list_metadata if not only_conflicts or meta.has_conflict
+    )
+    # Extensions without files still get a zero count
     for ext in FILE_EXTENSIONS:
-        if only_conflicts:
-            count = sum(
-                1 for meta in list_metadata if meta.ext == ext and meta.has_conflict
-            )
-        else:
-            count = sum(1 for meta in list_metadata if meta.ext == ext)
-        dict_file_counts[ext] = count
+        dict_file_counts.setdefault(ext, 0)
     return dict_file_counts
 
 
@@ -517,29 +808,56 @@ def process_files(list_metadata: list[FileMetadata], only_conflicts: bool = NO):
     check_conflicts(list_metadata, only_conflicts)
     find_file_counts(list_metadata, only_conflicts)
 
+    # Extract all dates in parallel; the work is I/O- and subprocess-bound,
+    # so it scales with the number of cores across files
+    dates_taken: list[int] = [0] * len(list_metadata)
+    if not only_conflicts and list_metadata:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            dates_taken = list(
+                executor.map(
+                    _extract_date,
+                    [
+                        (
+                            meta.actual_full_path,
+                            meta.ext_id,
+                            meta._ctime_ns,
+                            meta._mtime_ns,
+                        )
+                        for meta in list_metadata
+                    ],
+                    chunksize=32,
+                )
+            )
+
     # Process each file for metadata extraction
-    for meta in list_metadata:
+    for meta, date_taken_ns in zip(list_metadata, dates_taken):
         # Print header for the first file of each extension loop
         if meta.no == 1:
-            logger.info(str.center(f" {meta.ext.upper()} ", LINE_LENGTH, "="))  # type: ignore
+            logger.info(_EXT_HEADERS[meta.ext])
             file_number = dict_file_counts.get(meta.ext, 0)  # type: ignore
-            logger.info(f"{file_number} files being processed... ")
-            logger.info("-" * LINE_LENGTH)
+            logger.info("%s files being processed... ", file_number)
+            logger.info(LINE_DASH)
 
         # Log processing info when relevant
         if not only_conflicts or meta.has_conflict:
-            logger.info(f"{meta.no}- {meta.actual_full_name}")
+            logger.info("%s- %s", meta.no, meta.actual_full_name)
+
+        # A zero date means the worker could not read the file at all
+        if not only_conflicts and not date_taken_ns:
+            logger.error(
+                "%s- %s: Error: Could not extract a date for this file.",
+                meta.no,
+                meta.actual_full_name,
+            )
 
-        # Extract date_taken only in full processing mode
-        date_taken = None
-        if not only_conflicts:
-            date_taken = date_to_str(find_date_taken(meta))  # type: ignore
-        # Update metadata with extracted date
-        set_file_metadata(meta, date_taken=date_taken)  # type: ignore
+        # Update metadata with the date extracted by the worker pool
+        set_file_metadata(meta, date_taken_ns=date_taken_ns)
 
-    # Rebuild global dataframe only in full processing mode
+    # Rebuild the global index only in full processing mode
     if not only_conflicts:
-        create_df_global_media(list_metadata)
+        rebuild_media_index(list_metadata)
 
     # Identify mutual names before renaming
     search_mutual_names(list_metadata, only_conflicts)
@@ -553,86 +871,107 @@ def fetch_list_files(base_folder: str) -> list[FileMetadata]:
     list_metadata = []
 
     for root, _, _ in os.walk(base_folder):
-        for ext in FILE_EXTENSIONS:
-            cmd_dir = f'{CMD_DIR} "{root}\\*.{ext}"'
-
-            try:
-                # Execute directory listing command
-                result = subprocess.check_output(
-                    cmd_dir,
-                    shell=True,
-                    text=True,
-                    stderr=subprocess.DEVNULL,
+        # Single directory scan: filter by the compiled extension pattern
+        # and group by extension as we go, stat data in the same pass
+        groups: defaultdict[str, list] = defaultdict(list)
+        with os.scandir(root) as it:
+            for entry in it:
+                match = _EXT_PATTERN.search(entry.name)
+                if not match or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                groups[match.group(1).lower()].append(
+                    (entry.name, stat.st_mtime_ns, stat.st_ctime_ns)
                 )
 
-                # Build metadata objects for each file found
-                for i, file in enumerate(result.splitlines()):
-                    file_meta = FileMetadata()
-
-                    name, extension = file.split(".", 1)
-                    extension = extension.lower()
-
-                    set_file_metadata(
-                        file_meta,
-                        folder=root,
-                        first_name=name,
-                        actual_name=name,
-                        ext=extension,
-                        no=i + 1,
-                    )
-                    list_metadata.append(file_meta)
-            except subprocess.CalledProcessError:
-                # Ignore folders with no matching files
-                ...
-
-        # Rebuild global dataframe after fetching all files
-        create_df_global_media(list_metadata)
+        # Keep the per-extension grouping, ordered by earliest timestamp
+        # (reproduces the old `dir /o:d` semantics in memory)
+        for ext in FILE_EXTENSIONS:
+            files = groups.get(ext, [])
+            # Tie-break equal timestamps by name so repeat runs stay stable
+            files.sort(key=lambda e: (min(e[1], e[2]), e[0]))
+
+            # Build metadata objects for each file found
+            for i, (file, mtime_ns, ctime_ns) in enumerate(files):
+                file_meta = FileMetadata()
+
+                name = file.rsplit(".", 1)[0]
+
+                set_file_metadata(
+                    file_meta,
+                    folder=root,
+                    first_name=name,
+                    actual_name=name,
+                    ext=ext,
+                    no=i + 1,
+                )
+                # Keep the on-disk spelling for the actual name and path;
+                # the canonical lowercase ext is only for ids and grouping
+                file_meta.actual_full_name = file
+                file_meta.actual_full_path = concat_full_path(root, file)
+                # Stash stat timestamps so later OS-date lookups are free
+                file_meta._mtime_ns = mtime_ns
+                file_meta._ctime_ns = ctime_ns
+                list_metadata.append(file_meta)
+
+    # Build the global index once, after the whole walk
+    rebuild_media_index(list_metadata)
     return list_metadata
 
 
 # Global variables
-df_global_media = pd.DataFrame()
+list_global_media: list[FileMetadata] = []
+by_date_ext: defaultdict[tuple[int, int], list[FileMetadata]] = defaultdict(list)
+by_actual_name: defaultdict[str | None, list[FileMetadata]] = defaultdict(list)
+_exiftool_proc: subprocess.Popen | None = None
+_exiftool_unavailable = NO
 dict_file_counts: dict[str, int] = {}
 dict_conflict_counts: dict[str, int] = {}
 
 # Initialize logger
 logger = lib_logger.setup_logging(APP_NAME)
-logger.info("\n" + "=" * LINE_LENGTH)
-logger.info(
-    str.center(
-        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - MEDIA RENAMER STARTED",
-        LINE_LENGTH,
-        " ",
-    )
-)
 
 # Enable HEIC support
 register_heif_opener()
 
-# Process each year folder
-for yyyy in YEARS:
-    logger.info("\n" + str.center(f" {yyyy} ", LINE_LENGTH, "*"))
+# Guarded so worker processes can import this module without re-running
+# the pipeline (required by ProcessPoolExecutor on Windows spawn)
+if __name__ == "__main__":
+    logger.info("\n" + LINE_EQUAL)
+    logger.info(
+        str.center(
+            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - MEDIA RENAMER STARTED",
+            LINE_LENGTH,
+            " ",
+        )
+    )
+
+    # Process each year folder
+    for yyyy in YEARS:
+        logger.info("\n" + str.center(f" {yyyy} ", LINE_LENGTH, "*"))
 
-    dir_year = f"{BASE}/{yyyy}"
-    list_metadata = fetch_list_files(dir_year)
+        dir_year = f"{BASE}/{yyyy}"
+        list_metadata = fetch_list_files(dir_year)
 
-    # Extract metadata and rename files
-    process_files(list_metadata)
+        # Extract metadata and rename files
+        process_files(list_metadata)
 
-    # Resolve any conflicts found
-    start_for_conflicts(list_metadata)
-    process_files(list_metadata, only_conflicts=YES)
+        # Resolve any conflicts found
+        start_for_conflicts(list_metadata)
+        process_files(list_metadata, only_conflicts=YES)
 
-# Test block (optional)
-# dir_year = r"C:\Users\aykan\Desktop"
-# list_metadata = fetch_list_files(dir_year)
-# process_files(list_metadata)
+    # Test block (optional)
+    # dir_year = r"C:\Users\aykan\Desktop"
+    # list_metadata = fetch_list_files(dir_year)
+    # process_files(list_metadata)
 
-# # Resolve any conflicts found
-# initialize_conflicts(list_metadata)
-# process_files(list_metadata, only_conflicts=YES)
+    # # Resolve any conflicts found
+    # initialize_conflicts(list_metadata)
+    # process_files(list_metadata, only_conflicts=YES)
 
-# Final log
-logger.info("=" * LINE_LENGTH)
-logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - MEDIA RENAMER FINISHED")
-logger.info("=" * LINE_LENGTH)
+    # Final log
+    logger.info(LINE_EQUAL)
+    logger.info(
+        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - MEDIA RENAMER FINISHED"
+    )
+    logger.info(LINE_EQUAL)
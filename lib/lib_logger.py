@@ -22,6 +22,7 @@ conflict resolution, and unexpected failures in a reproducible manner.
 """
 
 import logging
+import logging.handlers
 import os
 from datetime import datetime
 
@@ -74,22 +75,29 @@ def setup_logging(app_name: str) -> logging.Logger:
     info_console.setFormatter(info_formatter)
     info_console.addFilter(MaxLevelFilter(logging.WARNING))
 
-    info_file = logging.FileHandler(log_path, mode="a", encoding="utf-8")
+    # File handlers open lazily (delay) and are wrapped in MemoryHandlers
+    # so writes hit the disk in batches; buffers flush when full, on the
+    # first ERROR record, and at shutdown
+    info_file = logging.FileHandler(log_path, mode="a", encoding="utf-8", delay=True)
     info_file.setLevel(logging.INFO)
     info_file.setFormatter(info_formatter)
     info_file.addFilter(MaxLevelFilter(logging.WARNING))
+    info_buffer = logging.handlers.MemoryHandler(capacity=1024, target=info_file)
+    info_buffer.setLevel(logging.INFO)
 
     # --- HANDLER: ERROR (Screen + File) ---
     error_console = logging.StreamHandler()
     error_console.setLevel(logging.ERROR)
     error_console.setFormatter(error_formatter)
 
-    error_file = logging.FileHandler(log_path, mode="a", encoding="utf-8")
+    error_file = logging.FileHandler(log_path, mode="a", encoding="utf-8", delay=True)
     error_file.setLevel(logging.ERROR)
     error_file.setFormatter(error_formatter)
+    error_buffer = logging.handlers.MemoryHandler(capacity=1024, target=error_file)
+    error_buffer.setLevel(logging.ERROR)
 
     # --- HANDLER: DEBUG (Only File) ---
-    debug_file = logging.FileHandler(log_path, mode="a", encoding="utf-8")
+    debug_file = logging.FileHandler(log_path, mode="a", encoding="utf-8", delay=True)
     debug_file.setLevel(logging.DEBUG)
     debug_file.setFormatter(debug_formatter)
 
@@ -100,9 +108,9 @@ def setup_logging(app_name: str) -> logging.Logger:
     # Add handlers to root logger
     if not logger.handlers:
         logger.addHandler(info_console)
-        logger.addHandler(info_file)
+        logger.addHandler(info_buffer)
         logger.addHandler(error_console)
-        logger.addHandler(error_file)
+        logger.addHandler(error_buffer)
         # logger.addHandler(debug_file)
 
     return logger